@@ -0,0 +1,141 @@
+"""Prime sieve and pairwise composite kernels shared by the prime vowel scripts.
+
+Both ``prime-vowel.py`` and ``prime_vowel_mapping.py`` import from here, so
+the sieve backends and the O(n^2) pair arithmetic only live in one place.
+Vowel labels stay in the scripts; this module only deals in integers.
+"""
+
+import functools
+import importlib.util
+from typing import Callable, Tuple
+
+import numpy as np
+
+try:
+    import primesieve.numpy as primesieve_np
+except ImportError:  # primesieve is optional; fall back to the Numba/NumPy sieves.
+    primesieve_np = None
+
+# numba is optional and takes a noticeable fraction of a second to import and
+# load its cached kernels, so it is only imported once a call is large enough
+# for the compiled code to pay that back; smaller inputs use NumPy.
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Smallest sieve limit, and smallest number of prime pairs, handed to Numba.
+NUMBA_SIEVE_LIMIT = 10**8
+NUMBA_PAIR_LIMIT = 10**7
+
+# Number of distinct limits whose primes are kept in memory by sieve().
+SIEVE_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _jit(func: Callable) -> Callable:
+    """Compile ``func`` with Numba the first time it is needed."""
+
+    from numba import njit
+
+    return njit(cache=True)(func)
+
+
+def _sieve_np(limit: int) -> np.ndarray:
+    """Return all primes below ``limit`` using a NumPy sieve of Eratosthenes."""
+
+    is_prime = np.ones(max(limit, 2), dtype=np.bool_)
+    is_prime[:2] = False
+    is_prime[4::2] = False
+    for p in range(3, int(limit**0.5) + 1, 2):
+        if is_prime[p]:
+            is_prime[p * p :: 2 * p] = False
+    return np.nonzero(is_prime)[0]
+
+
+def _odd_sieve_bits(limit: int) -> np.ndarray:
+    """Return an odd-only sieve where ``bits[k]`` marks whether ``2k + 1`` is prime."""
+
+    bits = np.ones(limit // 2, dtype=np.bool_)
+    bits[0] = False
+    for i in range(3, int(limit**0.5) + 1, 2):
+        if bits[i >> 1]:
+            bits[(i * i) >> 1 :: i] = False
+    return bits
+
+
+def _sieve_numba(limit: int) -> np.ndarray:
+    """Return all primes below ``limit`` using the JIT-compiled odd-only sieve."""
+
+    odd_primes = 2 * np.nonzero(_jit(_odd_sieve_bits)(limit))[0] + 1
+    return np.concatenate((np.array([2], dtype=odd_primes.dtype), odd_primes))
+
+
+def _sieve_primesieve(limit: int) -> np.ndarray:
+    """Return all primes below ``limit`` using libprimesieve's segmented sieve."""
+
+    # primesieve's upper bound is inclusive.
+    return primesieve_np.primes(limit - 1)
+
+
+def _sieve_backend(limit: int) -> np.ndarray:
+    """Pick the fastest available sieve for ``limit``."""
+
+    if primesieve_np is not None:
+        return _sieve_primesieve(limit)
+    if _HAVE_NUMBA and limit >= NUMBA_SIEVE_LIMIT:
+        return _sieve_numba(limit)
+    return _sieve_np(limit)
+
+
+@functools.lru_cache(maxsize=SIEVE_CACHE_SIZE)
+def sieve(limit: int) -> np.ndarray:
+    """Return a read-only int64 array of all primes below ``limit``, memoized per limit."""
+
+    if limit <= 2:
+        primes = np.empty(0, dtype=np.int64)
+    else:
+        primes = _sieve_backend(limit).astype(np.int64, copy=False)
+    primes.flags.writeable = False
+    return primes
+
+
+def _composites_loop(primes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fill the sum, product and index columns pair by pair (compiled with Numba)."""
+
+    n = primes.shape[0]
+    count = n * (n - 1) // 2
+    sums = np.empty(count, dtype=np.int64)
+    products = np.empty(count, dtype=np.int64)
+    pair_indices = np.empty((count, 2), dtype=np.int64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            sums[k] = primes[i] + primes[j]
+            products[k] = primes[i] * primes[j]
+            pair_indices[k, 0] = i
+            pair_indices[k, 1] = j
+            k += 1
+    return sums, products, pair_indices
+
+
+def _composites_np(primes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the same columns as ``_composites_loop`` with whole-array NumPy operations."""
+
+    left, right = np.triu_indices(primes.size, k=1)
+    pair_indices = np.stack((left, right), axis=1).astype(np.int64, copy=False)
+    return primes[left] + primes[right], primes[left] * primes[right], pair_indices
+
+
+def compute_composites(primes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return ``(sums, products, pair_indices)`` for every pair of ``primes``.
+
+    Row ``k`` describes the pair ``primes[pair_indices[k, 0]]`` and
+    ``primes[pair_indices[k, 1]]``. Pairs are in ``np.triu_indices`` order,
+    i.e. row by row with the first index strictly below the second.
+    """
+
+    # Numba compiles read-only arrays (such as sieve() results) as a separate
+    # type, so always pass a fresh writable copy to keep a single signature.
+    primes = np.array(primes, dtype=np.int64)
+    if _HAVE_NUMBA and primes.size * (primes.size - 1) // 2 >= NUMBA_PAIR_LIMIT:
+        return _jit(_composites_loop)(primes)
+    return _composites_np(primes)
@@ -1,14 +1,20 @@
 # Prime Vowel Mapping Project
 
+import argparse
+import functools
 import itertools
+import math
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, DefaultDict, Dict, FrozenSet, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import networkx as nx
-import plotly.graph_objs as go
-import plotly.io as pio
-from sympy import factorint, primerange
+import numpy as np
+
+from core import compute_composites, sieve
 
 # Define mapping of the first few primes to vowels. Remaining primes reuse
 # vowels in order to keep the mapping readable for large ranges.
@@ -22,6 +28,60 @@ prime_to_vowel = {
 
 fallback_vowels = ["A", "E", "I", "O", "U", "Y"]
 
+# Exact prime powers grow far too quickly to compute for every pair, so the
+# exponentiation composite is reported in one of these cheaper forms.
+ExponentMode = Literal["symbolic", "log", "modular", "skip"]
+EXPONENT_MODULUS = 2**61 - 1
+
+# Largest power, in bits, that --materialize-exponents will expand to an int.
+MATERIALIZE_BIT_LIMIT = 64
+
+# Number of distinct limits (and prime sequences) whose vowel mappings are kept
+# in memory by generate_vowel_mappings and prime_to_vowel_string.
+MAPPING_CACHE_SIZE = 32
+
+# Number of distinct factorizations kept in memory by find_prime_factors.
+FACTOR_CACHE_SIZE = 4096
+
+# Numbers up to this bound are factorized by trial division over the cached
+# sieve; anything larger (or below 2) is handed to sympy.
+TRIAL_DIVISION_LIMIT = 10**12
+
+# Number of distinct spring layouts kept in memory by the plotting functions.
+LAYOUT_CACHE_SIZE = 8
+
+# Node placement used by the plots. The prime graph is complete, so a circle
+# is both the cheapest and the most legible default; "spring" warm-starts
+# Fruchterman-Reingold from the circle (and from the previous spring layout,
+# for nodes it shares) with a reduced iteration count.
+# The spectral layout is not offered: every non-trivial Laplacian eigenvalue
+# of a complete graph is equal, so its positions are arbitrary and overlap.
+LayoutKind = Literal["circular", "spring"]
+SPRING_ITERATIONS = 20
+
+# The most recent spring layout, keyed by its (node set, edge set). Nodes that
+# appear again in a later, different graph start from where they were drawn.
+_last_spring_layout: Optional[
+    Tuple[Tuple[FrozenSet[int], FrozenSet[Tuple[int, int]]], Dict[int, np.ndarray]]
+] = None
+
+# Operation codes stored in CompositesTable.ops, and how each one cases the
+# vowels of its (first, second) prime when building a label.
+OPERATIONS = ("Sum", "Product", "Exponentiation")
+SUM, PRODUCT, EXPONENTIATION = range(len(OPERATIONS))
+_LABEL_CASES: Dict[int, Tuple[Callable[[str], str], Callable[[str], str]]] = {
+    SUM: (str.upper, str.upper),
+    PRODUCT: (str.lower, str.upper),
+    EXPONENTIATION: (str.upper, str.lower),
+}
+
+# Number of prime pairs converted to Python objects at a time when iterating
+# over a CompositesTable.
+_ROW_CHUNK = 4096
+
+# Value column dtype used for "symbolic" exponentiation composites.
+_PRIME_POWER_DTYPE = np.dtype([("base", np.int64), ("exponent", np.int64)])
+
 
 @dataclass
 class CompositeMapping:
@@ -29,116 +89,311 @@ class CompositeMapping:
 
     primes: Tuple[int, int]
     operation: str
-    value: int
+    value: Union[int, float, "PrimePower"]
     label: str
 
 
+@dataclass(frozen=True)
+class PrimePower:
+    """An unevaluated ``base**exponent``, printed as ``base^exponent``."""
+
+    base: int
+    exponent: int
+
+    def __str__(self) -> str:
+        return f"{self.base}^{self.exponent}"
+
+    def materialize(self, max_bits: int = MATERIALIZE_BIT_LIMIT) -> Union[int, "PrimePower"]:
+        """Return the power as an int, or ``self`` if it would exceed ``max_bits`` bits."""
+
+        if self.exponent * math.log2(self.base) > max_bits:
+            return self
+        return self.base**self.exponent
+
+
+@dataclass(frozen=True, eq=False)
+class CompositesTable:
+    """
+    Columnar store of composites: one row per prime pair and operation.
+
+    Pair ``k`` joins ``primes[left[k]]`` and ``primes[right[k]]``, and
+    ``values[m][k]`` holds the result of operation ``ops[m]`` for that pair.
+    Rows are ordered pair by pair, with each pair's operations in ``ops``
+    order. Labels and CompositeMapping records are only built when iterated.
+    """
+
+    primes: np.ndarray
+    vowels: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    ops: np.ndarray
+    values: Tuple[np.ndarray, ...]
+
+    def __len__(self) -> int:
+        return self.left.size * self.ops.size
+
+    def __iter__(self) -> Iterator[CompositeMapping]:
+        primes = self.primes.tolist()
+        operations = [OPERATIONS[op] for op in self.ops.tolist()]
+        labels = self.iter_labels()
+        for left, right, columns in self._iter_chunks():
+            for k, (i, j) in enumerate(zip(left, right)):
+                p1, p2 = primes[i], primes[j]
+                pair = (p1, p2) if p1 < p2 else (p2, p1)
+                for operation, column in zip(operations, columns):
+                    yield CompositeMapping(primes=pair, operation=operation, value=column[k], label=next(labels))
+
+    def iter_labels(self) -> Iterator[str]:
+        """Yield the vowel label of every row in row order."""
+
+        # Concatenate pre-cased vowel arrays with np.char.add so labels for a
+        # whole slice of pairs are built in one call per operation.
+        vowels = self.vowels.tolist()
+        cased = [
+            (np.array([first(v) for v in vowels], dtype=np.str_), np.array([second(v) for v in vowels], dtype=np.str_))
+            for first, second in (_LABEL_CASES[op] for op in self.ops.tolist())
+        ]
+        for start in range(0, self.left.size, _ROW_CHUNK):
+            left = self.left[start : start + _ROW_CHUNK]
+            right = self.right[start : start + _ROW_CHUNK]
+            labels = np.stack([np.char.add(firsts[left], seconds[right]) for firsts, seconds in cased], axis=1)
+            yield from labels.ravel().tolist()
+
+    def _iter_chunks(self) -> Iterator[Tuple[List[int], List[int], List[list]]]:
+        """Yield pair indices and value columns as Python lists, a slice at a time."""
+
+        for start in range(0, self.left.size, _ROW_CHUNK):
+            stop = start + _ROW_CHUNK
+            yield (
+                self.left[start:stop].tolist(),
+                self.right[start:stop].tolist(),
+                [_column_to_list(column[start:stop]) for column in self.values],
+            )
+
+
+def _column_to_list(column: np.ndarray) -> list:
+    """Convert a value column to Python objects, rebuilding PrimePower records."""
+
+    if column.dtype == _PRIME_POWER_DTYPE:
+        return [PrimePower(base, exponent) for base, exponent in column.tolist()]
+    return column.tolist()
+
+
 def prime_to_vowel_string(primes: Iterable[int]) -> List[str]:
     """Map primes to vowel strings, cycling through a fallback list if needed."""
 
-    vowels: List[str] = []
-    for index, prime in enumerate(primes):
-        vowels.append(prime_to_vowel.get(prime, fallback_vowels[index % len(fallback_vowels)]))
-    return vowels
+    return list(_prime_to_vowel_tuple(tuple(primes)))
+
+
+@functools.lru_cache(maxsize=MAPPING_CACHE_SIZE)
+def _prime_to_vowel_tuple(primes: Tuple[int, ...]) -> Tuple[str, ...]:
+    """Vectorized, memoized core of ``prime_to_vowel_string``."""
+
+    primes_arr = np.asarray(primes, dtype=np.int64)
+    fallback_lut = np.array(fallback_vowels)
+    vowels = fallback_lut[np.arange(primes_arr.size) % fallback_lut.size]
+
+    known_primes = np.array(sorted(prime_to_vowel), dtype=np.int64)
+    known_vowels = np.array([prime_to_vowel[prime] for prime in known_primes])
+    mask = np.isin(primes_arr, known_primes)
+    vowels[mask] = known_vowels[np.searchsorted(known_primes, primes_arr[mask])]
+    return tuple(vowels.tolist())
 
 # Generate prime numbers in a range and apply vowel mapping
-def generate_vowel_mappings(limit: int) -> Tuple[List[int], List[str]]:
-    """Generate primes and their corresponding vowel mappings."""
+@functools.lru_cache(maxsize=MAPPING_CACHE_SIZE)
+def generate_vowel_mappings(limit: int) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Generate primes and their corresponding vowel mappings.
 
-    primes = list(primerange(2, limit))
-    vowel_mappings = prime_to_vowel_string(primes)
+    Results are memoized per ``limit`` and returned as tuples so that the
+    cached values cannot be modified by callers.
+    """
+
+    primes = tuple(sieve(limit).tolist())
+    vowel_mappings = _prime_to_vowel_tuple(primes)
     return primes, vowel_mappings
 
 # Define a function to compute composite values and map them to vowel representations
 def generate_composite_vowel_mappings(
-    primes: List[int], vowel_mappings: List[str]
-) -> Tuple[List[int], List[CompositeMapping]]:
+    primes: List[int], vowel_mappings: List[str], exponent_mode: ExponentMode = "symbolic"
+) -> CompositesTable:
     """
     Generate composites and their vowel mappings based on prime operations.
 
-    Returns both the raw composite numbers and richer mapping metadata so that
-    visualizations have a one-to-one correspondence with the generated values.
+    The arithmetic is done on whole arrays and returned as a CompositesTable;
+    iterate over it to get CompositeMapping records with their labels.
+
+    ``exponent_mode`` controls the exponentiation composite: ``"symbolic"``
+    keeps it as an unevaluated PrimePower, ``"log"`` stores the natural log of
+    the power, ``"modular"`` stores the power modulo ``EXPONENT_MODULUS`` and
+    ``"skip"`` omits it entirely.
     """
 
-    composites: List[int] = []
-    composite_mappings: List[CompositeMapping] = []
+    primes_arr = np.asarray(primes, dtype=np.int64)
+    sums, products, pair_indices = compute_composites(primes_arr)
+    left, right = pair_indices[:, 0], pair_indices[:, 1]
+    return _composites_table(
+        primes_arr, np.asarray(vowel_mappings), left, right, sums, products, exponent_mode
+    )
 
-    for (p1, v1), (p2, v2) in itertools.combinations(zip(primes, vowel_mappings), 2):
-        composites, composite_mappings = _add_composites_for_pair(
-            p1, p2, v1, v2, composites, composite_mappings
-        )
 
-    return composites, composite_mappings
-
-
-def _add_composites_for_pair(
-    p1: int,
-    p2: int,
-    v1: str,
-    v2: str,
-    composites: List[int],
-    composite_mappings: List[CompositeMapping],
-) -> Tuple[List[int], List[CompositeMapping]]:
-    """Add composites for a pair of primes and return the augmented collections."""
-
-    operations: Dict[str, Tuple[int, str]] = {
-        "Sum": (p1 + p2, f"{v1.upper()}{v2.upper()}"),
-        "Product": (p1 * p2, f"{v1.lower()}{v2.upper()}"),
-        "Exponentiation": (
-            p1**p2 if p1 < p2 else p2**p1,
-            f"{v1.upper()}{v2.lower()}",
-        ),
-    }
+def iter_composite_mappings(
+    primes: List[int], vowel_mappings: List[str], exponent_mode: ExponentMode = "symbolic"
+) -> Iterator[CompositeMapping]:
+    """
+    Yield the same records as ``generate_composite_vowel_mappings`` without storing them all.
+
+    Pairs are generated a block of rows at a time, so working memory stays
+    proportional to the number of primes rather than the number of pairs.
+    """
+
+    primes_arr = np.asarray(primes, dtype=np.int64)
+    vowels = np.asarray(vowel_mappings)
+    for left, right in _iter_pair_blocks(primes_arr.size):
+        p1s, p2s = primes_arr[left], primes_arr[right]
+        yield from _composites_table(primes_arr, vowels, left, right, p1s + p2s, p1s * p2s, exponent_mode)
+
+
+def _iter_pair_blocks(n: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield upper-triangle pair indices in row order, roughly ``_ROW_CHUNK`` pairs per block."""
+
+    rows: List[int] = []
+    pending = 0
+    for i in range(n - 1):
+        rows.append(i)
+        pending += n - 1 - i
+        if pending >= _ROW_CHUNK or i == n - 2:
+            left = np.repeat(np.array(rows, dtype=np.intp), [n - 1 - row for row in rows])
+            right = np.concatenate([np.arange(row + 1, n, dtype=np.intp) for row in rows])
+            yield left, right
+            rows = []
+            pending = 0
+
+
+def _composites_table(
+    primes_arr: np.ndarray,
+    vowels: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    sums: np.ndarray,
+    products: np.ndarray,
+    exponent_mode: ExponentMode,
+) -> CompositesTable:
+    """Add the exponentiation values to the precomputed sums and products of the given pairs."""
+
+    p1s, p2s = primes_arr[left], primes_arr[right]
+
+    ops = [SUM, PRODUCT]
+    values = [sums, products]
+    if exponent_mode != "skip":
+        ops.append(EXPONENTIATION)
+        values.append(_exponent_values(np.minimum(p1s, p2s), np.maximum(p1s, p2s), exponent_mode))
+
+    return CompositesTable(
+        primes=primes_arr,
+        vowels=vowels,
+        left=left,
+        right=right,
+        ops=np.array(ops, dtype=np.uint8),
+        values=tuple(values),
+    )
 
-    for operation, (value, label) in operations.items():
-        composites.append(value)
-        composite_mappings.append(
-            CompositeMapping(primes=tuple(sorted((p1, p2))), operation=operation, value=value, label=label)
-        )
 
-    return composites, composite_mappings
+def _exponent_values(
+    bases: np.ndarray, exponents: np.ndarray, exponent_mode: ExponentMode
+) -> np.ndarray:
+    """Return cheap stand-ins for ``bases**exponents`` according to ``exponent_mode``."""
+
+    if exponent_mode == "symbolic":
+        powers = np.empty(bases.size, dtype=_PRIME_POWER_DTYPE)
+        powers["base"], powers["exponent"] = bases, exponents
+        return powers
+    if exponent_mode == "log":
+        return exponents * np.log(bases)
+    if exponent_mode == "modular":
+        residues = [pow(base, exponent, EXPONENT_MODULUS) for base, exponent in zip(bases.tolist(), exponents.tolist())]
+        return np.array(residues, dtype=np.int64)
+    raise ValueError(f"Unknown exponent mode: {exponent_mode!r}")
 
 # Visualize vowel patterns
 def visualize_vowel_patterns(
-    primes: List[int], vowel_mappings: List[str], composites: List[int], composite_mappings: List[CompositeMapping]
+    primes: List[int],
+    vowel_mappings: List[str],
+    composites: Iterable[CompositeMapping],
+    materialize_exponents: bool = False,
 ) -> None:
-    """Display the mappings between primes, composites, and vowels."""
+    """
+    Display the mappings between primes, composites, and vowels.
 
-    print("Prime Vowel Mapping:")
-    for prime, vowel in zip(primes, vowel_mappings):
-        print(f"{prime} -> {vowel}")
+    Symbolic powers are printed as ``base^exponent`` unless
+    ``materialize_exponents`` is set, in which case those that fit in
+    ``MATERIALIZE_BIT_LIMIT`` bits are printed as integers.
+    """
 
-    print("\nComposite Vowel Mapping:")
-    for composite, mapping in zip(composites, composite_mappings):
-        print(f"{composite} -> {mapping.label} ({mapping.operation})")
+    # Write in large batches rather than one print() per line; composites are
+    # joined a slice at a time so a streamed input is never held in full.
+    prime_lines = "".join(f"{prime} -> {vowel}\n" for prime, vowel in zip(primes, vowel_mappings))
+    sys.stdout.write(f"Prime Vowel Mapping:\n{prime_lines}\nComposite Vowel Mapping:\n")
+
+    composite_lines = (
+        f"{_display_value(mapping.value, materialize_exponents)} -> {mapping.label} ({mapping.operation})\n"
+        for mapping in composites
+    )
+    while True:
+        batch = "".join(itertools.islice(composite_lines, _ROW_CHUNK))
+        if not batch:
+            break
+        sys.stdout.write(batch)
+
+def _display_value(
+    value: Union[int, float, PrimePower], materialize_exponents: bool
+) -> Union[int, float, PrimePower]:
+    """Expand small symbolic powers when the user asked for materialized exponents."""
+
+    if materialize_exponents and isinstance(value, PrimePower):
+        return value.materialize()
+    return value
 
 # Plot vowel graph using Plotly
 def plot_vowel_graph(
     primes: List[int],
     vowel_mappings: List[str],
-    composite_mappings: List[CompositeMapping],
-) -> None:
-    """Plot an interactive graph showing prime and composite relationships."""
-
-    G = nx.Graph()
-
-    for prime, vowel in zip(primes, vowel_mappings):
-        G.add_node(prime, label=vowel)
+    composite_mappings: Iterable[CompositeMapping],
+    layout: LayoutKind = "circular",
+    show: bool = True,
+) -> Tuple[nx.Graph, Dict[int, np.ndarray]]:
+    """
+    Plot an interactive graph showing prime and composite relationships.
 
-    edge_labels = _aggregate_edge_labels(composite_mappings)
-    for (p1, p2), label in edge_labels.items():
-        G.add_edge(p1, p2, label=label)
+    With ``show=False`` only the graph and its node positions are computed and
+    returned; Plotly is neither imported nor used to build a figure.
+    """
 
-    pos = nx.spring_layout(G)
-    edge_x: List[float] = []
-    edge_y: List[float] = []
-    edge_text: List[str] = []
-    for u, v, data in G.edges(data=True):
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-        edge_text.append(data["label"])
+    G = _build_graph(primes, vowel_mappings, composite_mappings)
+    pos = _compute_layout(G, layout)
+    if not show:
+        return G, pos
+
+    # Plotly is slow to import, so only load it once a figure is needed.
+    import plotly.graph_objs as go
+    import plotly.io as pio
+
+    # Each edge is drawn as (start, end, NaN); Plotly breaks the line at NaN
+    # just as it does at None, but the buffers stay contiguous float arrays.
+    # Screen coordinates need nowhere near float64 precision, so float32
+    # halves the buffers and the numbers serialized into the HTML.
+    edge_count = G.number_of_edges()
+    endpoints = np.fromiter(
+        (coord for u, v in G.edges() for coord in (*pos[u], *pos[v])),
+        dtype=np.float32,
+        count=4 * edge_count,
+    ).reshape(edge_count, 4)
+    edge_x = np.empty(3 * edge_count, dtype=np.float32)
+    edge_y = np.empty(3 * edge_count, dtype=np.float32)
+    edge_x[2::3] = edge_y[2::3] = np.nan
+    edge_x[0::3], edge_y[0::3] = endpoints[:, 0], endpoints[:, 1]
+    edge_x[1::3], edge_y[1::3] = endpoints[:, 2], endpoints[:, 3]
+    edge_text = [data["label"] for _, _, data in G.edges(data=True)]
 
     edge_trace = go.Scatter(
         x=edge_x,
@@ -149,18 +404,17 @@ def plot_vowel_graph(
         text=edge_text,
     )
 
-    node_x: List[float] = []
-    node_y: List[float] = []
-    node_text: List[str] = []
-    for node, data in G.nodes(data=True):
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(f"{node} ({data['label']})")
+    node_count = G.number_of_nodes()
+    node_xy = np.fromiter(
+        (coord for node in G.nodes() for coord in pos[node]),
+        dtype=np.float32,
+        count=2 * node_count,
+    ).reshape(node_count, 2)
+    node_text = [f"{node} ({data['label']})" for node, data in G.nodes(data=True)]
 
     node_trace = go.Scatter(
-        x=node_x,
-        y=node_y,
+        x=node_xy[:, 0],
+        y=node_xy[:, 1],
         mode="markers+text",
         hoverinfo="text",
         marker=dict(size=10, color="blue", line_width=2),
@@ -181,6 +435,39 @@ def plot_vowel_graph(
     )
 
     pio.write_html(fig, file="vowel_graph.html", auto_open=True)
+    return G, pos
+
+@functools.lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def _factorint_cached(number: int) -> Dict[int, int]:
+    """Factorize ``number``, reusing results for repeated inputs."""
+
+    if 2 <= number <= TRIAL_DIVISION_LIMIT:
+        return _trial_division(number)
+
+    # sympy is slow to import, so only load it once a factorization needs it.
+    from sympy import factorint
+
+    return factorint(number)
+
+
+def _trial_division(number: int) -> Dict[int, int]:
+    """Factorize ``number`` by dividing out every sieved prime up to its square root."""
+
+    # Rounding the sieve bound up to a power of two keeps the number of
+    # distinct sieve() calls, and so its cache entries, logarithmic in n.
+    candidates = sieve(1 << (math.isqrt(number) + 1).bit_length())
+    candidates = candidates[: np.searchsorted(candidates, math.isqrt(number), side="right")]
+    factors: Dict[int, int] = {}
+    for prime in candidates[number % candidates == 0].tolist():
+        power = 0
+        while number % prime == 0:
+            number //= prime
+            power += 1
+        factors[prime] = power
+    # At most one prime factor exceeds the square root of the original number.
+    if number > 1:
+        factors[number] = 1
+    return factors
 
 # Find prime factors of a number
 def find_prime_factors(number: int) -> Dict[int, int]:
@@ -193,7 +480,7 @@ def find_prime_factors(number: int) -> Dict[int, int]:
     Returns:
         dict: Dictionary of prime factors and their powers.
     """
-    factors = factorint(number)
+    factors = dict(_factorint_cached(number))
     print(f"Prime factors of {number}:")
     for prime, power in factors.items():
         print(f"{prime}^{power}")
@@ -201,56 +488,69 @@ def find_prime_factors(number: int) -> Dict[int, int]:
 
 # Static plot with Matplotlib
 def plot_static_graph(
-    primes: List[int], vowel_mappings: List[str], composite_mappings: List[CompositeMapping]
+    primes: List[int],
+    vowel_mappings: List[str],
+    composite_mappings: Iterable[CompositeMapping],
+    layout: LayoutKind = "circular",
 ) -> None:
     """Plot a static graph of prime and composite relationships using Matplotlib."""
 
-    G = nx.Graph()
-    for prime, vowel in zip(primes, vowel_mappings):
-        G.add_node(prime, label=vowel)
-
-    edge_labels = _aggregate_edge_labels(composite_mappings)
-    for (p1, p2), label in edge_labels.items():
-        G.add_edge(p1, p2, label=label)
-
-    pos = nx.spring_layout(G)
+    G = _build_graph(primes, vowel_mappings, composite_mappings)
+    pos = _compute_layout(G, layout)
     labels = nx.get_node_attributes(G, "label")
     edge_labels = nx.get_edge_attributes(G, "label")
 
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        labels=labels,
-        node_size=700,
-        node_color="skyblue",
-        font_size=10,
-        font_weight="bold",
-        edge_color="gray",
-    )
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color="red")
+    # Draw every node and edge with one scatter and one line collection
+    # instead of letting networkx add them one at a time.
+    nodes = list(G.nodes())
+    node_index = {node: k for k, node in enumerate(nodes)}
+    coords = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2)
+    edge_index = np.array([(node_index[u], node_index[v]) for u, v in G.edges()], dtype=np.intp).reshape(-1, 2)
+
+    _, ax = plt.subplots(figsize=(10, 8))
+    ax.add_collection(LineCollection(coords[edge_index], colors="gray", zorder=1))
+    ax.scatter(coords[:, 0], coords[:, 1], s=700, c="skyblue", zorder=2)
+    ax.autoscale_view()
+    ax.set_axis_off()
+    nx.draw_networkx_labels(G, pos, labels=labels, font_size=10, font_weight="bold", ax=ax)
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color="red", ax=ax)
     plt.show()
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Map primes and their composites to vowels.")
+    parser.add_argument(
+        "--materialize-exponents",
+        action="store_true",
+        help=f"Print exponentiation composites as integers when they fit in {MATERIALIZE_BIT_LIMIT} bits.",
+    )
+    return parser.parse_args()
+
 # Main function
 def main() -> None:
+    args = parse_args()
     try:
         limit = int(input("Enter the upper limit for prime generation: "))
         if limit <= 2:
             raise ValueError("Limit must be an integer greater than 2.")
 
         primes, vowel_mappings = generate_vowel_mappings(limit)
-        composites, composite_mappings = generate_composite_vowel_mappings(primes, vowel_mappings)
-        visualize_vowel_patterns(primes, vowel_mappings, composites, composite_mappings)
+        visualize_vowel_patterns(
+            primes,
+            vowel_mappings,
+            iter_composite_mappings(primes, vowel_mappings),
+            materialize_exponents=args.materialize_exponents,
+        )
 
         number_to_factor = int(input("Enter a number to find its prime factors: "))
         find_prime_factors(number_to_factor)
 
         visualization_choice = input("Choose visualization (static/interactive): ").strip().lower()
         if visualization_choice == "static":
-            plot_static_graph(primes, vowel_mappings, composite_mappings)
+            composites = generate_composite_vowel_mappings(primes, vowel_mappings)
+            plot_static_graph(primes, vowel_mappings, composites)
         elif visualization_choice == "interactive":
-            plot_vowel_graph(primes, vowel_mappings, composite_mappings)
+            composites = generate_composite_vowel_mappings(primes, vowel_mappings)
+            plot_vowel_graph(primes, vowel_mappings, composites)
         else:
             print("Invalid choice. Skipping visualization.")
 
@@ -258,14 +558,77 @@ def main() -> None:
         print(f"Invalid input: {e}")
 
 
-def _aggregate_edge_labels(composite_mappings: List[CompositeMapping]) -> Dict[Tuple[int, int], str]:
+def _build_graph(
+    primes: List[int], vowel_mappings: List[str], composite_mappings: Iterable[CompositeMapping]
+) -> nx.Graph:
+    """Build the prime graph with one labelled edge per prime pair."""
+
+    G = nx.Graph()
+    for prime, vowel in zip(primes, vowel_mappings):
+        G.add_node(prime, label=vowel)
+
+    edge_labels = _aggregate_edge_labels(composite_mappings)
+    for (p1, p2), label in edge_labels.items():
+        G.add_edge(p1, p2, label=label)
+    return G
+
+
+def _compute_layout(G: nx.Graph, kind: LayoutKind = "circular") -> Dict[int, np.ndarray]:
+    """Return node positions for ``G``; spring layouts are shared across graphs with the same shape."""
+
+    if kind not in ("circular", "spring"):
+        raise ValueError(f"Unknown layout kind: {kind!r}")
+    # The circle costs O(V) to compute, far less than hashing every edge for a
+    # cache lookup. Graphs with fewer than three nodes have nothing for a
+    # spring layout to improve (and spring_layout rejects an empty initial
+    # position map), so they are drawn on a circle too.
+    if kind == "circular" or G.number_of_nodes() < 3:
+        return nx.circular_layout(G)
+
+    global _last_spring_layout
+    key = (frozenset(G.nodes()), frozenset(G.edges()))
+    if _last_spring_layout is not None and _last_spring_layout[0] == key:
+        positions = _last_spring_layout[1]
+    else:
+        previous = _last_spring_layout[1] if _last_spring_layout is not None else {}
+        warm_start = tuple(
+            (node, float(xy[0]), float(xy[1])) for node, xy in sorted(previous.items()) if node in key[0]
+        )
+        positions = _spring_layout_cached(*key, warm_start)
+        _last_spring_layout = (key, positions)
+
+    # The cached layout is reused by later calls, so callers get their own copy.
+    return {node: xy.copy() for node, xy in positions.items()}
+
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _spring_layout_cached(
+    nodes: FrozenSet[int],
+    edges: FrozenSet[Tuple[int, int]],
+    warm_start: Tuple[Tuple[int, float, float], ...],
+) -> Dict[int, np.ndarray]:
+    """
+    Run the spring layout once per node set, edge set and set of starting positions.
+
+    Nodes listed in ``warm_start`` as ``(node, x, y)`` start there; the rest
+    start on the circle. Every node therefore has an initial position, so the
+    result is deterministic without a random seed.
+    """
+
+    G = nx.Graph()
+    G.add_nodes_from(sorted(nodes))
+    G.add_edges_from(edges)
+    initial = nx.circular_layout(G)
+    initial.update((node, np.array([x, y])) for node, x, y in warm_start)
+    return nx.spring_layout(G, pos=initial, iterations=SPRING_ITERATIONS)
+
+
+def _aggregate_edge_labels(composite_mappings: Iterable[CompositeMapping]) -> Dict[Tuple[int, int], str]:
     """Combine composite mappings for each prime pair into a readable label."""
 
-    edge_labels: Dict[Tuple[int, int], List[str]] = {}
+    edge_labels: DefaultDict[Tuple[int, int], List[str]] = defaultdict(list)
     for mapping in composite_mappings:
-        edge_labels.setdefault(mapping.primes, []).append(
-            f"{mapping.label} ({mapping.operation}: {mapping.value})"
-        )
+        edge_labels[mapping.primes].append(f"{mapping.label} ({mapping.operation}: {mapping.value})")
 
     return {primes: "\n".join(labels) for primes, labels in edge_labels.items()}
 
@@ -1,7 +1,18 @@
-from sympy import primerange
-import itertools
+import os
+import sys
+import matplotlib
+
+# Without a display there is nowhere to show a window, so fall back to the
+# non-interactive Agg backend unless the user picked one with MPLBACKEND
+if (sys.platform.startswith('linux') and not os.environ.get('MPLBACKEND')
+        and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+
+from core import compute_composites, sieve
 
 # Define mapping of primes to vowels
 prime_to_vowel = {
@@ -14,28 +25,37 @@ prime_to_vowel = {
 
 # Function to generate the vowel representation of a prime number
 # Extend this mapping using the corresponding first primes to their respective vowels
+# Primes are looked up in a dense table indexed by value, so the whole list is
+# mapped with one NumPy gather; anything outside the table maps to '?'
 def prime_to_vowel_string(primes):
-    return [prime_to_vowel.get(p, '?') for p in primes]
+    p = np.asarray(primes, dtype=np.int64)
+    vowel_lut = np.full(max(prime_to_vowel) + 1, '?')
+    vowel_lut[list(prime_to_vowel)] = list(prime_to_vowel.values())
+    vowels = np.full(p.shape, '?')
+    known = (p >= 0) & (p < vowel_lut.size)
+    vowels[known] = vowel_lut[p[known]]
+    return vowels.tolist()
 
 # Generate prime numbers in a range and apply vowel mapping
 def generate_vowel_mappings(limit):
-    primes = list(primerange(1, limit))  # Generate prime numbers up to 'limit'
+    primes = sieve(limit).tolist()  # Generate prime numbers up to 'limit'
     vowel_mappings = prime_to_vowel_string(primes) 
     return primes, vowel_mappings
 
-# Define a function to compute composite values and map them to vowel 
-representations
+# Define a function to compute composite values and map them to vowel representations
 def composite_vowel_mapping(primes, vowel_mappings):
-    composites = []
-    composite_mappings = []
-    
-    # Generate composites by multiplying each pair of primes
-    for (p1, v1), (p2, v2) in itertools.combinations(zip(primes, vowel_mappings), 2):
-        composite = p1 * p2
-        composites.append(composite)
-        # Use the lowercase-uppercase rule for distinguishing factor order
-        mapping = v1.lower() + v2.upper() if p1 < p2 else v2.lower() + v1.upper()
-        composite_mappings.append(mapping)
+    p = np.asarray(primes, dtype=np.int64)
+    vowels = np.asarray(vowel_mappings, dtype=np.str_)
+
+    # Generate composites by multiplying each pair of primes (shared kernel in core)
+    _, products, pair_indices = compute_composites(p)
+    i, j = pair_indices[:, 0], pair_indices[:, 1]
+    composites = products.tolist()
+    # Use the lowercase-uppercase rule for distinguishing factor order
+    lower, upper = np.char.lower(vowels), np.char.upper(vowels)
+    composite_mappings = np.where(
+        p[i] < p[j], np.char.add(lower[i], upper[j]), np.char.add(lower[j], upper[i])
+    ).tolist()
     return composites, composite_mappings
 
 # Define a visualization of vowel mappings
@@ -59,13 +79,17 @@ composite_mappings):
     for prime, vowel in zip(primes, vowel_mappings):
         G.add_node(prime, label=vowel)
     
-    # Add edges for composites
-    for (p1, p2), mapping in zip(itertools.combinations(primes, 2), 
-composite_mappings):
-        composite = p1 * p2
-        G.add_edge(p1, p2, label=mapping)
+    # Add one edge per prime pair, in the same upper-triangle order that
+    # composite_vowel_mapping uses for composite_mappings
+    i, j = np.triu_indices(len(primes), k=1)
+    G.add_edges_from(
+        (primes[a], primes[b], {'label': mapping})
+        for a, b, mapping in zip(i.tolist(), j.tolist(), composite_mappings)
+    )
     
-    pos = nx.spring_layout(G)
+    # Every pair of primes is joined, so a spring layout has no structure to
+    # find; place the primes in ascending order on a circle instead
+    pos = nx.circular_layout(G)
     labels = nx.get_node_attributes(G, 'label')
     edge_labels = nx.get_edge_attributes(G, 'label')
     
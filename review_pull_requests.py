@@ -3,8 +3,8 @@
 This script inspects the local Git history for merge commits whose
 messages follow the conventional "Merge pull request #<id>" format.
 It collects useful metadata – author, date, commit message, and
-diffstat information – and renders a concise Markdown report to
-aid manual code review.
+diffstat information – with a single ``git log`` invocation and
+renders a concise Markdown report to aid manual code review.
 
 Run the script directly to generate a ``PR_REVIEW_SUMMARY.md`` file::
 
@@ -12,7 +12,8 @@ Run the script directly to generate a ``PR_REVIEW_SUMMARY.md`` file::
 
 Use ``--stdout`` to write the summary to standard output instead of
 updating the Markdown file.  The script only requires the ``git`` CLI
-to be available in the current repository.
+(2.31 or newer, for ``--diff-merges``) to be available in the current
+repository.
 """
 
 from __future__ import annotations
@@ -20,37 +21,58 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
-
-
-MERGE_LINE = re.compile(r"Merge pull request #(\d+)")
+from typing import Iterable, Iterator, List, Optional
+
+
+# Git output is parsed as bytes; only the fields that reach the report are
+# decoded, so these patterns and separators are all bytes as well.
+MERGE_LINE = re.compile(rb"Merge pull request #(\d+)")
+# Record/unit separators let one ``git log`` call return every merge commit's
+# metadata followed by its diffstat.
+RECORD_SEPARATOR = b"\x1e"
+FIELD_SEPARATOR = b"\x1f"
+MERGE_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ad%x1f%s%x1f%B%x1f"
+FILE_STAT_LINE = re.compile(rb"^[ \t]*([^|\n]*?)[ \t]*\|[ \t]*(.*?)[ \t]*$", re.MULTILINE)
 SUMMARY_LINE = re.compile(
-    r"(?P<files>\d+) file[s]? changed(?:, (?P<insertions>\d+) insertion[s]?\(\+\))?"
-    r"(?:, (?P<deletions>\d+) deletion[s]?\(-\))?"
+    rb"(?P<files>\d+) file[s]? changed(?:, (?P<insertions>\d+) insertion[s]?\(\+\))?"
+    rb"(?:, (?P<deletions>\d+) deletion[s]?\(-\))?"
 )
 
+# Fixed pieces of the Markdown report.
+REPORT_HEADER = "# Pull Request Review Summary\n\n"
+GENERATED_BY_LINE = "Generated by `review_pull_requests.py`.\n\n"
+NO_MERGES_MESSAGE = "No merge commits were found in this repository."
+BODY_HEADER = "\n**Commit message body:**\n\n"
+FILES_TABLE_HEADER = "\n**Files changed:**\n\n| File | Diffstat |\n| --- | --- |\n"
+
 
 class GitError(RuntimeError):
     """Wrap subprocess errors to provide clearer git context."""
 
 
-def run_git_command(args: Iterable[str]) -> str:
-    """Run a git command and return its standard output."""
+def run_git_command(args: Iterable[str]) -> bytes:
+    """Run a git command and return its raw standard output."""
 
     result = subprocess.run(
         ["git", *args],
         check=False,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
     )
     if result.returncode != 0:
-        raise GitError(result.stderr.strip() or "git command failed")
+        raise GitError(decode(result.stderr).strip() or "git command failed")
     return result.stdout
 
 
+def decode(data: bytes) -> str:
+    """Decode a field of git output for the report, replacing invalid UTF-8."""
+
+    return data.decode("utf-8", errors="replace")
+
+
 @dataclass
 class PullRequestSummary:
     commit: str
@@ -77,19 +99,20 @@ def get_merge_commits(limit: int) -> List[tuple[str, str, Optional[int]]]:
     output = run_git_command(
         [
             "log",
+            "-z",
             "--merges",
             f"--max-count={limit}",
             "--pretty=format:%H%x00%s",
         ]
     )
+    # With -z both the fields and the commits are NUL-separated, so a single
+    # split yields alternating hashes and subjects.
+    fields = output.split(b"\x00") if output else []
     commits: List[tuple[str, str, Optional[int]]] = []
-    for line in output.strip().splitlines():
-        if not line:
-            continue
-        commit, subject = line.split("\x00", 1)
+    for commit, subject in zip(fields[0::2], fields[1::2]):
         match = MERGE_LINE.search(subject)
         pr_number = int(match.group(1)) if match else None
-        commits.append((commit, subject, pr_number))
+        commits.append((decode(commit), decode(subject), pr_number))
     return commits
 
 
@@ -104,19 +127,28 @@ def extract_commit_details(commit: str) -> tuple[str, str, str]:
             "--pretty=format:%an%x00%ad%x00%B",
         ]
     )
-    author, date, body = output.split("\x00", 2)
-    return author.strip(), date.strip(), body.strip()
+    author, date, body = output.split(b"\x00", 2)
+    return decode(author).strip(), decode(date).strip(), decode(body).strip()
 
 
 def parse_diffstat(commit: str) -> tuple[int, int, int, List[tuple[str, str]]]:
     """Return diffstat aggregates and per-file summaries for a commit."""
 
     output = run_git_command(["show", "--stat", "--pretty=format:", commit])
-    lines = [line.rstrip() for line in output.splitlines() if line.strip()]
-    if not lines:
+    return parse_stat_output(output)
+
+
+def parse_stat_output(output: bytes) -> tuple[int, int, int, List[tuple[str, str]]]:
+    """Parse ``--stat`` output into diffstat aggregates and per-file summaries."""
+
+    # Only the final non-empty line holds the totals; take it from the tail
+    # instead of splitting and stripping every line of the output.
+    output = output.rstrip()
+    if not output:
         return 0, 0, 0, []
+    entries, _, tail = output.rpartition(b"\n")
 
-    summary_match = SUMMARY_LINE.search(lines[-1])
+    summary_match = SUMMARY_LINE.search(tail)
     files_changed = int(summary_match.group("files")) if summary_match else 0
     insertions = (
         int(summary_match.group("insertions")) if summary_match and summary_match.group("insertions") else 0
@@ -125,12 +157,9 @@ def parse_diffstat(commit: str) -> tuple[int, int, int, List[tuple[str, str]]]:
         int(summary_match.group("deletions")) if summary_match and summary_match.group("deletions") else 0
     )
 
-    file_summaries: List[tuple[str, str]] = []
-    for entry in lines[:-1]:
-        if "|" not in entry:
-            continue
-        filename, stats = entry.split("|", 1)
-        file_summaries.append((filename.strip(), stats.strip()))
+    file_summaries = [
+        (decode(match.group(1)), decode(match.group(2))) for match in FILE_STAT_LINE.finditer(entries)
+    ]
 
     return files_changed, insertions, deletions, file_summaries
 
@@ -156,47 +185,85 @@ def build_summary(commit_info: tuple[str, str, Optional[int]]) -> PullRequestSum
     )
 
 
-def render_markdown(summaries: List[PullRequestSummary]) -> str:
-    lines = ["# Pull Request Review Summary", ""]
-    if not summaries:
-        lines.append("No merge commits were found in this repository.")
-        return "\n".join(lines)
+def collect_summaries(limit: int) -> List[PullRequestSummary]:
+    """Summarize recent merge commits with a single ``git log`` invocation.
 
-    lines.append("Generated by `review_pull_requests.py`.\n")
+    Diffstats are taken against each merge's first parent, matching what
+    ``git show --stat`` reports for a merge commit.
+    """
 
+    output = run_git_command(
+        [
+            "log",
+            "--merges",
+            f"--max-count={limit}",
+            "--stat",
+            "--diff-merges=first-parent",
+            f"--pretty=format:{MERGE_LOG_FORMAT}",
+        ]
+    )
+    summaries: List[PullRequestSummary] = []
+    for record in output.split(RECORD_SEPARATOR):
+        if not record.strip():
+            continue
+        commit, author, date, subject, body, stat = record.split(FIELD_SEPARATOR, 5)
+        match = MERGE_LINE.search(subject)
+        files_changed, insertions, deletions, file_summaries = parse_stat_output(stat)
+        summaries.append(
+            PullRequestSummary(
+                commit=decode(commit),
+                title=decode(subject),
+                pr_number=int(match.group(1)) if match else None,
+                author=decode(author).strip(),
+                date=decode(date).strip(),
+                body=decode(body).strip(),
+                files_changed=files_changed,
+                insertions=insertions,
+                deletions=deletions,
+                file_summaries=file_summaries,
+            )
+        )
+    return summaries
+
+
+def iter_markdown(summaries: Iterable[PullRequestSummary]) -> Iterator[str]:
+    """Yield the Markdown report in small chunks so it can be written incrementally."""
+
+    yield REPORT_HEADER
+    empty = True
     for summary in summaries:
-        lines.append(f"## {summary.identifier}: {summary.title}")
-        lines.append("")
-        lines.append(f"- **Commit:** `{summary.commit}`")
-        lines.append(f"- **Author:** {summary.author}")
-        lines.append(f"- **Date:** {summary.date}")
-        lines.append(
+        yield GENERATED_BY_LINE if empty else "\n"
+        empty = False
+
+        yield f"## {summary.identifier}: {summary.title}\n\n"
+        yield f"- **Commit:** `{summary.commit}`\n"
+        yield f"- **Author:** {summary.author}\n"
+        yield f"- **Date:** {summary.date}\n"
+        yield (
             f"- **Changes:** {summary.files_changed} file(s), "
-            f"{summary.insertions} insertion(s), {summary.deletions} deletion(s)"
+            f"{summary.insertions} insertion(s), {summary.deletions} deletion(s)\n"
         )
         if summary.body:
-            lines.append("")
-            lines.append("**Commit message body:**")
-            lines.append("")
+            yield BODY_HEADER
             for body_line in summary.body.splitlines():
-                lines.append(f"> {body_line}" if body_line else ">")
+                yield f"> {body_line}\n" if body_line else ">\n"
 
         if summary.file_summaries:
-            lines.append("")
-            lines.append("**Files changed:**")
-            lines.append("")
-            lines.append("| File | Diffstat |")
-            lines.append("| --- | --- |")
+            yield FILES_TABLE_HEADER
             for filename, stats in summary.file_summaries:
-                lines.append(f"| {filename} | {stats} |")
+                yield f"| {filename} | {stats} |\n"
+
+    if empty:
+        yield NO_MERGES_MESSAGE
 
-        lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+def render_markdown(summaries: List[PullRequestSummary]) -> str:
+    return "".join(iter_markdown(summaries))
 
 
-def write_markdown(path: Path, content: str) -> None:
-    path.write_text(content, encoding="utf-8")
+def write_markdown(path: Path, chunks: Iterable[str]) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.writelines(chunks)
 
 
 def parse_args() -> argparse.Namespace:
@@ -223,14 +290,14 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    merge_commits = get_merge_commits(args.limit)
-    summaries = [build_summary(info) for info in merge_commits]
-    markdown = render_markdown(summaries)
+    summaries = collect_summaries(args.limit)
+    chunks = iter_markdown(summaries)
 
     if args.stdout:
-        print(markdown)
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
     else:
-        write_markdown(args.output, markdown)
+        write_markdown(args.output, chunks)
 
 
 if __name__ == "__main__":